@@ -21,6 +21,29 @@ Usage:
         --offset 0.4225 --scale 0.1975 --wind-speed 5.0 \
         --u-voltage 0.01 --u-offset 0.0024 --u-scale 0.002
 
+    # Evaluate a whole range of wind speeds in one vectorized pass
+    python uncertainty-calculator.py \
+        --offset 0.4225 --scale 0.1975 --sweep --wind-speed-range 1:25:25
+
+    # Cross-check with a GUM Supplement 1 Monte Carlo simulation
+    python uncertainty-calculator.py \
+        --offset 0.4225 --scale 0.1975 --wind-speed 5.0 --monte-carlo 1000000
+
+    # Per-sample uncertainty for a data logger CSV (voltages in column 1)
+    python uncertainty-calculator.py \
+        --offset 0.4225 --scale 0.1975 --csv-in logger.csv --csv-out results.csv
+
+    # u_c(v) over a 20 x 20 grid of u(OFFSET) x u(SCALE) at 5 m/s
+    python uncertainty-calculator.py \
+        --offset 0.4225 --scale 0.1975 --wind-speed 5.0 --sensitivity-analysis \
+        --u-offset-range 0.001:0.01:20 --u-scale-range 0.001:0.005:20
+
+The Monte Carlo kernel is compiled with Numba when it is installed
+(pip install numba) and falls back to plain NumPy otherwise.
+
+For streamed DAQ data, wind_uncertainty_c() uses the optional C kernel in
+wind_uncertainty.c once it is built as libwind_uncertainty.so (see that file).
+
 Reference: 
     - Main guide Appendix C.4.2
     - ISO/IEC Guide 98-3:2008 (GUM)
@@ -32,9 +55,97 @@ Version: 1.0
 Date: 2026-01-03
 """
 
-import argparse
+# NumPy, Numba, argparse, ctypes, json and csv are imported on first use so
+# that the common single-point invocation starts as fast as plain Python
+import bisect
+import collections
+import functools
+import numbers
+import os
 import sys
 import math
+import types
+
+# Default input uncertainties (see --help)
+DEFAULT_U_VOLTAGE = 0.01
+DEFAULT_U_OFFSET = 0.002
+DEFAULT_U_SCALE = 0.002
+
+# Defaults for every optional command-line argument. The parser and the
+# fast path in _parse_fast_args() both read them from here, so a new
+# option only needs adding once.
+_CLI_DEFAULTS = {
+    'wind_speed': None,
+    'sweep': False,
+    'wind_speed_range': (1.0, 25.0, 25),
+    'monte_carlo': None,
+    'csv_in': None,
+    'csv_out': None,
+    'csv_skiprows': 0,
+    'sensitivity_analysis': False,
+    'u_offset_range': (0.001, 0.01, 20),
+    'u_scale_range': (0.001, 0.005, 20),
+    'plot': None,
+    'format': 'text',
+    'u_voltage': DEFAULT_U_VOLTAGE,
+    'u_offset': DEFAULT_U_OFFSET,
+    'u_scale': DEFAULT_U_SCALE,
+}
+
+# Coverage factor for expanded uncertainty (k=2, approximately 95% confidence)
+COVERAGE_FACTOR = 2
+
+# Report layout (65 characters wide)
+_DOUBLE_LINE = "═" * 65
+_SINGLE_LINE = "─" * 65
+_TABLE_SEPARATOR = "─" * 20 + "┼" + "─" * 13 + "┼" + "─" * 13 + "┼" + "─" * 13
+_REPORT_TITLE = "║" + " " * 8 + "Wind Speed Uncertainty Analysis (GUM Method)" + " " * 12 + "║"
+_SWEEP_TITLE = "║" + " " * 9 + "Wind Speed Uncertainty Sweep (GUM Method)" + " " * 13 + "║"
+
+# Coverage probability (%) of a Normal distribution for common coverage
+# factors; other k fall back to the Chebyshev lower bound 1 - 1/k²
+_K_TO_COVERAGE = {1: "68", 2: "95", 3: "99.7"}
+
+# Uncertainty quality by relative uncertainty (%): a value below
+# _QUALITY_THRESHOLDS[i] gets _QUALITIES[i], anything higher gets the last entry
+_QUALITY_THRESHOLDS = (3.0, 5.0, 10.0)
+_QUALITIES = (
+    ("Excellent", "Suitable for publication-quality research."),
+    ("Good", "Suitable for most research applications."),
+    ("Acceptable", "Suitable for preliminary studies."),
+    ("Poor", "Consider recalibration or better equipment."),
+)
+
+# (source, advice) for the voltage, OFFSET and SCALE contributions, in that order
+_DOMINANT_SOURCES = (
+    ("Voltage measurement", "Use a more accurate multimeter or ADC."),
+    ("OFFSET calibration", "Improve zero-point measurement procedure (more readings, better environment)."),
+    ("SCALE calibration", "Use more calibration points or better reference anemometer."),
+)
+
+# Result of a scalar GUM uncertainty analysis (fields in report order)
+UncertaintyResult = collections.namedtuple('UncertaintyResult', (
+    'wind_speed', 'voltage', 'offset', 'scale',
+    'u_voltage', 'u_offset', 'u_scale',
+    'dv_dV', 'dv_dOffset', 'dv_dScale',
+    'contrib_voltage', 'contrib_offset', 'contrib_scale',
+    'u_combined', 'U_expanded', 'k', 'relative_uncertainty_pct',
+))
+
+# Result fields, in report order
+RESULT_FIELDS = UncertaintyResult._fields
+INPUT_FIELDS = ('voltage', 'offset', 'scale', 'u_voltage', 'u_offset', 'u_scale')
+
+def _numpy():
+    """Import NumPy on first use; scalar calculations never need it."""
+    import numpy
+    return numpy
+
+def _is_scalar(x):
+    """True for Python and NumPy real scalars."""
+    # float/int covers the common case (np.float64 subclasses float) without
+    # the slower ABC check
+    return isinstance(x, (float, int)) or isinstance(x, numbers.Real)
 
 def calculate_voltage_from_wind_speed(wind_speed, offset, scale):
     """Calculate voltage from wind speed using calibration equation."""
@@ -52,19 +163,99 @@ def calculate_partial_derivatives(voltage, offset, scale):
     ∂v/∂OFFSET = -1/SCALE
     ∂v/∂SCALE = -(V - OFFSET) / SCALE²
     
+    Works element-wise when given NumPy arrays.
+    
     Returns:
         tuple: (dv_dV, dv_dOffset, dv_dScale)
     """
-    dv_dV = 1.0 / scale
-    dv_dOffset = -1.0 / scale
-    dv_dScale = -(voltage - offset) / (scale ** 2)
+    inv_scale = 1.0 / scale
+    dv_dV = inv_scale
+    dv_dOffset = -inv_scale
+    dv_dScale = -(voltage - offset) * (inv_scale * inv_scale)
     
     return dv_dV, dv_dOffset, dv_dScale
 
-def calculate_combined_uncertainty(voltage, offset, scale, u_voltage, u_offset, u_scale):
+def _specialize(source, offset, scale):
+    """Compile a lambda from source with calibration constants as literals."""
+    offset, scale = float(offset), float(scale)
+    if not (math.isfinite(offset) and math.isfinite(scale)) or scale == 0:
+        raise ValueError("OFFSET and SCALE must be finite and SCALE non-zero")
+    inv_scale = 1.0 / scale
+    source = source.format(
+        offset=repr(offset),
+        inv_scale=repr(inv_scale),
+        neg_inv_scale=repr(-inv_scale),
+        neg_inv_scale_sq=repr(-(inv_scale * inv_scale)),
+    )
+    return eval(compile(source, "<specialized>", "eval"))
+
+def make_specialized_converter(offset, scale):
+    """
+    Build a voltage -> wind speed converter for one fixed calibration.
+    
+    OFFSET and 1/SCALE are baked into the generated code as literals, e.g.
+    lambda V: (V - 0.4225) * 5.063291139240506, so each call is one subtract
+    and one multiply. The one-off compile (~20 µs) pays for itself after a
+    few thousand conversions, so use it for streamed data rather than single
+    readings. Accepts floats or NumPy arrays.
+    
+    Returns:
+        callable: v = f(V)
+    """
+    return _specialize("lambda V: (V - {offset}) * {inv_scale}", offset, scale)
+
+def make_specialized_derivatives(offset, scale):
+    """
+    Build a specialized version of calculate_partial_derivatives().
+    
+    1/SCALE and 1/SCALE² become literal constants; see
+    make_specialized_converter().
+    
+    Returns:
+        callable: (dv_dV, dv_dOffset, dv_dScale) = f(V)
+    """
+    return _specialize(
+        "lambda V: ({inv_scale}, {neg_inv_scale}, {neg_inv_scale_sq} * (V - {offset}))",
+        offset, scale
+    )
+
+def _compute_core(voltage, offset, scale, u_voltage, u_offset, u_scale):
+    """
+    Scalar GUM propagation without building a results dict.
+    
+    Returns:
+        tuple: (wind_speed, u_combined, U_expanded,
+                contrib_voltage, contrib_offset, contrib_scale,
+                dv_dV, dv_dOffset, dv_dScale)
+    """
+    # Calculate wind speed
+    wind_speed = calculate_wind_speed_from_voltage(voltage, offset, scale)
+    
+    # Calculate partial derivatives
+    dv_dV, dv_dOffset, dv_dScale = calculate_partial_derivatives(voltage, offset, scale)
+    
+    # Calculate uncertainty contributions
+    pv = dv_dV * u_voltage
+    po = dv_dOffset * u_offset
+    ps = dv_dScale * u_scale
+    
+    # Combined standard uncertainty (root sum of squares)
+    u_combined = math.hypot(pv, po, ps)
+    
+    # Expanded uncertainty
+    U_expanded = COVERAGE_FACTOR * u_combined
+    
+    return (wind_speed, u_combined, U_expanded, abs(pv), abs(po), abs(ps),
+            dv_dV, dv_dOffset, dv_dScale)
+
+def calculate_combined_uncertainty(voltage, offset, scale, u_voltage, u_offset, u_scale,
+                                   return_full=True):
     """
     Calculate combined standard uncertainty using GUM methodology.
     
+    Scalar input returns an UncertaintyResult. Array input is handed to
+    calculate_combined_uncertainty_batch() and returns a dict of arrays.
+    
     Args:
         voltage: Measured voltage (V)
         offset: Calibration OFFSET constant (V)
@@ -72,124 +263,587 @@ def calculate_combined_uncertainty(voltage, offset, scale, u_voltage, u_offset,
         u_voltage: Standard uncertainty in voltage measurement (V)
         u_offset: Standard uncertainty in OFFSET (V)
         u_scale: Standard uncertainty in SCALE (V/(m/s))
+        return_full: If False, skip the results dict and return only
+            (wind_speed, u_combined, U_expanded)
     
     Returns:
-        dict: Uncertainty analysis results
+        UncertaintyResult: Uncertainty analysis results (dict of arrays for
+        array input, tuple if return_full is False)
     """
-    # Calculate wind speed
-    wind_speed = calculate_wind_speed_from_voltage(voltage, offset, scale)
+    inputs = (voltage, offset, scale, u_voltage, u_offset, u_scale)
+    if not (_is_scalar(voltage) and _is_scalar(offset) and _is_scalar(scale) and
+            _is_scalar(u_voltage) and _is_scalar(u_offset) and _is_scalar(u_scale)):
+        results = calculate_combined_uncertainty_batch(*inputs)
+        if not return_full:
+            return results['wind_speed'], results['u_combined'], results['U_expanded']
+        return results
     
-    # Calculate partial derivatives
-    dv_dV, dv_dOffset, dv_dScale = calculate_partial_derivatives(voltage, offset, scale)
+    core = _compute_core(*inputs)
+    if not return_full:
+        return core[:3]
     
-    # Calculate uncertainty contributions
-    contrib_voltage = abs(dv_dV * u_voltage)
-    contrib_offset = abs(dv_dOffset * u_offset)
-    contrib_scale = abs(dv_dScale * u_scale)
+    (wind_speed, u_combined, U_expanded, contrib_voltage, contrib_offset, contrib_scale,
+     dv_dV, dv_dOffset, dv_dScale) = core
     
-    # Combined standard uncertainty (root sum of squares)
-    u_combined = math.sqrt(
-        (dv_dV * u_voltage)**2 +
-        (dv_dOffset * u_offset)**2 +
-        (dv_dScale * u_scale)**2
+    # Relative uncertainty
+    relative_uncertainty_pct = (u_combined / wind_speed) * 100 if wind_speed > 0 else 0
+    
+    return UncertaintyResult(
+        wind_speed=wind_speed,
+        voltage=voltage,
+        offset=offset,
+        scale=scale,
+        u_voltage=u_voltage,
+        u_offset=u_offset,
+        u_scale=u_scale,
+        dv_dV=dv_dV,
+        dv_dOffset=dv_dOffset,
+        dv_dScale=dv_dScale,
+        contrib_voltage=contrib_voltage,
+        contrib_offset=contrib_offset,
+        contrib_scale=contrib_scale,
+        u_combined=u_combined,
+        U_expanded=U_expanded,
+        k=COVERAGE_FACTOR,
+        relative_uncertainty_pct=relative_uncertainty_pct
     )
+
+def empty_batch_results(shape):
+    """
+    Allocate output buffers for calculate_combined_uncertainty_batch(out=...).
     
-    # Expanded uncertainty (k=2, approximately 95% confidence)
-    k = 2
-    U_expanded = k * u_combined
+    Returns:
+        dict: One uninitialized float64 array of the given shape per field
+        in RESULT_FIELDS, except 'k' which holds the coverage factor
+    """
+    np = _numpy()
+    return {field: COVERAGE_FACTOR if field == 'k' else np.empty(shape)
+            for field in RESULT_FIELDS}
+
+def calculate_combined_uncertainty_batch(voltage, offset, scale, u_voltage, u_offset, u_scale,
+                                         out=None):
+    """
+    Calculate combined standard uncertainty for many samples at once.
     
-    # Relative uncertainty
-    relative_uncertainty_pct = (u_combined / wind_speed) * 100 if wind_speed > 0 else 0
+    Structure-of-arrays counterpart of calculate_combined_uncertainty():
+    every result field is a single NumPy array with the broadcast shape of
+    the inputs, filled in place by vectorized operations.
+    
+    For streaming, allocate buffers once with empty_batch_results() and pass
+    them as `out` for every chunk of the same size; no new result arrays are
+    allocated. Inputs must not share memory with the `out` buffers.
+    
+    Args:
+        voltage: Measured voltages (V), array-like
+        offset: Calibration OFFSET constant(s) (V)
+        scale: Calibration SCALE constant(s) (V/(m/s))
+        u_voltage: Standard uncertainty in voltage measurement (V)
+        u_offset: Standard uncertainty in OFFSET (V)
+        u_scale: Standard uncertainty in SCALE (V/(m/s))
+        out: Optional dict of float64 arrays (see empty_batch_results()) to
+            write the results into
+    
+    Returns:
+        dict: One np.ndarray per field in RESULT_FIELDS, except 'k' which is
+        the scalar coverage factor (the `out` dict itself if given)
+    """
+    np = _numpy()
+    
+    # Derived calibration constants, computed before broadcasting so a
+    # fixed OFFSET/SCALE costs one division for the whole batch
+    inv_scale = 1.0 / np.asarray(scale, dtype=float)
+    neg_inv_scale = -inv_scale
+    neg_inv_scale_sq = -(inv_scale * inv_scale)
+    
+    inputs = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in
+          (voltage, offset, scale, u_voltage, u_offset, u_scale))
+    )
+    shape = inputs[0].shape
+    
+    if out is None:
+        results = empty_batch_results(shape)
+    else:
+        for field in RESULT_FIELDS:
+            if field == 'k':
+                continue
+            buffer = out.get(field)
+            if (not isinstance(buffer, np.ndarray) or buffer.shape != shape
+                    or buffer.dtype != np.float64):
+                raise ValueError(f"out['{field}'] must be a float64 array of shape {shape}")
+        results = out
+    results['k'] = COVERAGE_FACTOR
+    
+    for field, value in zip(INPUT_FIELDS, inputs):
+        results[field][...] = value
+    
+    wind_speed = results['wind_speed']
+    dv_dV = results['dv_dV']
+    dv_dOffset = results['dv_dOffset']
+    dv_dScale = results['dv_dScale']
+    contrib_voltage = results['contrib_voltage']
+    contrib_offset = results['contrib_offset']
+    contrib_scale = results['contrib_scale']
+    u_combined = results['u_combined']
+    U_expanded = results['U_expanded']
+    relative_uncertainty_pct = results['relative_uncertainty_pct']
+    
+    # (V - OFFSET) is shared by the wind speed and the SCALE sensitivity;
+    # it is staged in the dv_dScale buffer
+    np.subtract(results['voltage'], results['offset'], out=dv_dScale)
+    np.multiply(dv_dScale, inv_scale, out=wind_speed)
+    np.multiply(dv_dScale, neg_inv_scale_sq, out=dv_dScale)
+    dv_dV[...] = inv_scale
+    dv_dOffset[...] = neg_inv_scale
+    
+    np.multiply(dv_dV, results['u_voltage'], out=contrib_voltage)
+    np.multiply(dv_dOffset, results['u_offset'], out=contrib_offset)
+    np.multiply(dv_dScale, results['u_scale'], out=contrib_scale)
+    np.abs(contrib_voltage, out=contrib_voltage)
+    np.abs(contrib_offset, out=contrib_offset)
+    np.abs(contrib_scale, out=contrib_scale)
+    
+    # Root sum of squares, using U_expanded as scratch space
+    np.multiply(contrib_voltage, contrib_voltage, out=u_combined)
+    np.multiply(contrib_offset, contrib_offset, out=U_expanded)
+    u_combined += U_expanded
+    np.multiply(contrib_scale, contrib_scale, out=U_expanded)
+    u_combined += U_expanded
+    np.sqrt(u_combined, out=u_combined)
+    
+    np.multiply(u_combined, COVERAGE_FACTOR, out=U_expanded)
+    
+    # Relative uncertainty is reported as 0 where wind speed is not positive
+    relative_uncertainty_pct.fill(0)
+    np.divide(u_combined, wind_speed, out=relative_uncertainty_pct, where=wind_speed > 0)
+    relative_uncertainty_pct *= 100
+    
+    return results
+
+@functools.lru_cache(maxsize=None)
+def _load_c_library():
+    """Load libwind_uncertainty.so from this folder, or return None if not built."""
+    import ctypes
+    
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libwind_uncertainty.so')
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    
+    c_double_p = ctypes.POINTER(ctypes.c_double)
+    lib.wind_uncertainty_batch.argtypes = [
+        c_double_p, ctypes.c_size_t,
+        ctypes.c_double, ctypes.c_double,
+        ctypes.c_double, ctypes.c_double, ctypes.c_double,
+        c_double_p, c_double_p
+    ]
+    lib.wind_uncertainty_batch.restype = None
+    return lib
+
+def wind_uncertainty_c(voltage, offset, scale, u_voltage, u_offset, u_scale):
+    """
+    Wind speed and combined standard uncertainty for a block of voltages.
+    
+    Uses the compiled C kernel (wind_uncertainty.c) when libwind_uncertainty.so
+    has been built, and calculate_combined_uncertainty_batch() otherwise.
+    Calibration constants and uncertainties must be scalars.
+    
+    Returns:
+        tuple: (wind_speed, u_combined) as NumPy arrays shaped like voltage
+    """
+    import ctypes
+    np = _numpy()
+    
+    voltage = np.asarray(voltage, dtype=np.float64)
+    lib = _load_c_library()
+    if lib is None:
+        results = calculate_combined_uncertainty_batch(
+            voltage, offset, scale, u_voltage, u_offset, u_scale
+        )
+        return results['wind_speed'], results['u_combined']
+    
+    # The kernel works on a flat contiguous block; ravel() only copies
+    # when voltage is not already C-contiguous
+    flat_voltage = voltage.ravel()
+    wind_speed = np.empty_like(flat_voltage)
+    u_combined = np.empty_like(flat_voltage)
+    c_double_p = ctypes.POINTER(ctypes.c_double)
+    lib.wind_uncertainty_batch(
+        flat_voltage.ctypes.data_as(c_double_p), flat_voltage.size,
+        offset, scale, u_voltage, u_offset, u_scale,
+        wind_speed.ctypes.data_as(c_double_p), u_combined.ctypes.data_as(c_double_p)
+    )
+    return wind_speed.reshape(voltage.shape), u_combined.reshape(voltage.shape)
+
+def _monte_carlo_samples_numpy(voltage, offset, scale, u_v, u_o, u_s, n_trials):
+    """Draw Monte Carlo wind speed samples with NumPy (fallback without Numba)."""
+    np = _numpy()
+    V = np.random.normal(voltage, u_v, n_trials)
+    O = np.random.normal(offset, u_o, n_trials)
+    S = np.random.normal(scale, u_s, n_trials)
+    return (V - O) / S
+
+@functools.lru_cache(maxsize=None)
+def _monte_carlo_kernel():
+    """
+    Return (kernel, engine) for Monte Carlo sampling.
+    
+    The kernel is compiled with Numba on first use when it is installed
+    (and cached on disk); otherwise the NumPy version is used.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return _monte_carlo_samples_numpy, 'numpy'
+    
+    np = _numpy()
+    
+    @njit('float64[:](float64, float64, float64, float64, float64, float64, int64)',
+          cache=True, fastmath=True, parallel=True)
+    def _monte_carlo_samples(voltage, offset, scale, u_v, u_o, u_s, n_trials):
+        """Draw Monte Carlo wind speed samples (Numba-compiled, parallel over trials)."""
+        samples = np.empty(n_trials)
+        for i in prange(n_trials):
+            V = np.random.normal(voltage, u_v)
+            O = np.random.normal(offset, u_o)
+            S = np.random.normal(scale, u_s)
+            samples[i] = (V - O) / S
+        return samples
+    
+    return _monte_carlo_samples, 'numba'
+
+def monte_carlo_uncertainty(voltage, offset, scale, u_voltage, u_offset, u_scale,
+                            n_trials=100000, coverage=0.95):
+    """
+    Estimate wind speed uncertainty by Monte Carlo simulation (GUM Supplement 1).
+    
+    Each input is sampled from a Gaussian distribution with the given standard
+    uncertainty and propagated through the calibration equation. Unlike the
+    analytic method this makes no linearity assumption about SCALE.
+    
+    Args:
+        voltage: Measured voltage (V)
+        offset: Calibration OFFSET constant (V)
+        scale: Calibration SCALE constant (V/(m/s))
+        u_voltage: Standard uncertainty in voltage measurement (V)
+        u_offset: Standard uncertainty in OFFSET (V)
+        u_scale: Standard uncertainty in SCALE (V/(m/s))
+        n_trials: Number of Monte Carlo trials
+        coverage: Coverage probability of the reported interval
+    
+    Returns:
+        dict: Monte Carlo results (mean, standard uncertainty, coverage interval)
+    """
+    np = _numpy()
+    kernel, engine = _monte_carlo_kernel()
+    samples = kernel(
+        float(voltage), float(offset), float(scale),
+        float(u_voltage), float(u_offset), float(u_scale), int(n_trials)
+    )
+    
+    # Probabilistically symmetric coverage interval
+    tail_pct = (1 - coverage) / 2 * 100
+    interval_low, interval_high = np.percentile(samples, [tail_pct, 100 - tail_pct])
     
     return {
-        'wind_speed': wind_speed,
-        'voltage': voltage,
-        'offset': offset,
-        'scale': scale,
-        'u_voltage': u_voltage,
-        'u_offset': u_offset,
-        'u_scale': u_scale,
-        'dv_dV': dv_dV,
-        'dv_dOffset': dv_dOffset,
-        'dv_dScale': dv_dScale,
-        'contrib_voltage': contrib_voltage,
-        'contrib_offset': contrib_offset,
-        'contrib_scale': contrib_scale,
-        'u_combined': u_combined,
-        'U_expanded': U_expanded,
-        'k': k,
-        'relative_uncertainty_pct': relative_uncertainty_pct
+        'n_trials': int(n_trials),
+        'mean': float(np.mean(samples)),
+        'u_combined': float(np.std(samples, ddof=1)),
+        'coverage': coverage,
+        'interval_low': float(interval_low),
+        'interval_high': float(interval_high),
+        'engine': engine
     }
 
-def print_results(results):
-    """Print formatted uncertainty analysis results."""
-    
-    print("\n" + "═" * 65)
-    print("║" + " " * 8 + "Wind Speed Uncertainty Analysis (GUM Method)" + " " * 12 + "║")
-    print("═" * 65)
-    
-    print("\nINPUT PARAMETERS:")
-    print("─" * 65)
-    print(f"Measured voltage (V):          {results['voltage']:.4f} V")
-    print(f"Calibration OFFSET:            {results['offset']:.4f} V")
-    print(f"Calibration SCALE:             {results['scale']:.4f} V/(m/s)")
-    print(f"Calculated wind speed:         {results['wind_speed']:.2f} m/s")
-    
-    print("\nUNCERTAINTY CONTRIBUTIONS:")
-    print("─" * 65)
-    print(f"{'Source':<20} | {'Sensitivity':<11} | {'Uncertainty':<11} | {'Contribution'}")
-    print("─" * 20 + "┼" + "─" * 13 + "┼" + "─" * 13 + "┼" + "─" * 13)
-    print(f"{'Voltage measurement':<20} | {results['dv_dV']:>7.3f} m/s/V | {results['u_voltage']:>7.4f} V    | {results['contrib_voltage']:>7.4f} m/s")
-    print(f"{'OFFSET constant':<20} | {results['dv_dOffset']:>7.3f} m/s/V | {results['u_offset']:>7.4f} V    | {results['contrib_offset']:>7.4f} m/s")
-    print(f"{'SCALE constant':<20} | {results['dv_dScale']:>7.2f} m²/s  | {results['u_scale']:>7.4f} V/m/s | {results['contrib_scale']:>7.4f} m/s")
-    
-    print("\nCOMBINED UNCERTAINTY:")
-    print("─" * 65)
-    print(f"Standard uncertainty u_c(v):   {results['u_combined']:.4f} m/s")
-    print(f"Expanded uncertainty U(k={results['k']}):   {results['U_expanded']:.4f} m/s ({int((1 - 1/results['k']**2)*100)}% confidence)")
-    print(f"Relative uncertainty:          {results['relative_uncertainty_pct']:.2f}%")
-    
-    print("\nRESULT:")
-    print("═" * 65)
-    print(f"Wind speed: {results['wind_speed']:.2f} ± {results['U_expanded']:.2f} m/s (k={results['k']})")
-    print("═" * 65)
-    
-    print("\nINTERPRETATION:")
-    print("─" * 65)
-    if results['relative_uncertainty_pct'] < 3:
-        quality = "Excellent"
-        recommendation = "Suitable for publication-quality research."
-    elif results['relative_uncertainty_pct'] < 5:
-        quality = "Good"
-        recommendation = "Suitable for most research applications."
-    elif results['relative_uncertainty_pct'] < 10:
-        quality = "Acceptable"
-        recommendation = "Suitable for preliminary studies."
-    else:
-        quality = "Poor"
-        recommendation = "Consider recalibration or better equipment."
-    
-    print(f"Uncertainty quality: {quality}")
-    print(f"Recommendation: {recommendation}")
-    
-    print("\nDOMINANT UNCERTAINTY SOURCE:")
-    print("─" * 65)
-    max_contrib = max(results['contrib_voltage'], results['contrib_offset'], results['contrib_scale'])
-    if max_contrib == results['contrib_voltage']:
-        dominant = "Voltage measurement"
-        advice = "Use a more accurate multimeter or ADC."
-    elif max_contrib == results['contrib_offset']:
-        dominant = "OFFSET calibration"
-        advice = "Improve zero-point measurement procedure (more readings, better environment)."
-    else:
-        dominant = "SCALE calibration"
-        advice = "Use more calibration points or better reference anemometer."
+def process_csv(csv_in, csv_out, offset, scale, u_voltage, u_offset, u_scale, skiprows=0):
+    """
+    Calculate uncertainty for every voltage in a CSV file in one vectorized pass.
+    
+    Voltages are read from the first column of csv_in. The output has one row
+    per sample with columns V, wind_speed, u_combined, U_expanded.
+    
+    Args:
+        csv_in: Input CSV path (or file object)
+        csv_out: Output CSV path (or file object)
+        skiprows: Number of leading rows (e.g. a header) to skip in csv_in
+    
+    Returns:
+        int: Number of samples processed
+    """
+    np = _numpy()
+    
+    voltage = np.loadtxt(csv_in, delimiter=',', usecols=0, skiprows=skiprows, ndmin=1)
+    results = calculate_combined_uncertainty_batch(
+        voltage, offset, scale, u_voltage, u_offset, u_scale
+    )
+    np.savetxt(
+        csv_out,
+        np.column_stack([voltage, results['wind_speed'],
+                         results['u_combined'], results['U_expanded']]),
+        fmt='%.10g', delimiter=',', comments='',
+        header='V,wind_speed,u_combined,U_expanded'
+    )
+    return voltage.size
+
+def calculate_sensitivity_grid(voltage, offset, scale, u_voltage, u_offset_values, u_scale_values):
+    """
+    Combined standard uncertainty over a grid of u(OFFSET) x u(SCALE) values.
+    
+    Answers "what if" questions such as how far u(OFFSET) must drop for
+    u_c(v) to fall below a target, in one broadcast NumPy pass.
     
-    print(f"Largest contributor: {dominant} ({max_contrib:.4f} m/s)")
-    print(f"To improve accuracy: {advice}")
-    print()
+    Args:
+        voltage: Measured voltage (V)
+        offset: Calibration OFFSET constant (V)
+        scale: Calibration SCALE constant (V/(m/s))
+        u_voltage: Standard uncertainty in voltage measurement (V)
+        u_offset_values: Candidate u(OFFSET) values (V), length M
+        u_scale_values: Candidate u(SCALE) values (V/(m/s)), length N
+    
+    Returns:
+        np.ndarray: u_c(v) in m/s, shape (M, N), rows follow u_offset_values
+    """
+    np = _numpy()
+    
+    dv_dV, dv_dOffset, dv_dScale = calculate_partial_derivatives(voltage, offset, scale)
+    pv = dv_dV * u_voltage
+    po = dv_dOffset * np.asarray(u_offset_values, dtype=float)[:, None]
+    ps = dv_dScale * np.asarray(u_scale_values, dtype=float)[None, :]
+    
+    return np.sqrt(pv * pv + po * po + ps * ps)
 
-def main():
+def write_sensitivity_grid(grid, u_offset_values, u_scale_values, file):
+    """Write a sensitivity grid as CSV: one row per u(OFFSET), one column per u(SCALE)."""
+    np = _numpy()
+    
+    header = "u_offset/u_scale," + ",".join(f"{u:.10g}" for u in u_scale_values)
+    np.savetxt(file, np.column_stack([u_offset_values, grid]),
+               fmt='%.10g', delimiter=',', comments='', header=header)
+
+def plot_sensitivity_grid(grid, u_offset_values, u_scale_values, wind_speed, path):
+    """Save a heatmap of a sensitivity grid, if matplotlib is installed."""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("WARNING: matplotlib not installed, skipping --plot", file=sys.stderr)
+        return
+    
+    def axis_limits(values):
+        low, high = values[0], values[-1]
+        if low == high:
+            # Single-value range: give its one cell a nonzero width
+            half_width = abs(low) * 0.05 or 0.5
+            low, high = low - half_width, high + half_width
+        return low, high
+    
+    fig, ax = plt.subplots()
+    image = ax.imshow(
+        grid, origin='lower', aspect='auto',
+        extent=(*axis_limits(u_scale_values), *axis_limits(u_offset_values))
+    )
+    fig.colorbar(image, ax=ax, label='u_c(v) (m/s)')
+    ax.set_xlabel('u(SCALE) (V/(m/s))')
+    ax.set_ylabel('u(OFFSET) (V)')
+    ax.set_title(f'Combined standard uncertainty at {wind_speed:g} m/s')
+    fig.savefig(path, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+
+def parse_range(text):
+    """
+    Parse a 'start:stop:n' range specification.
+    
+    Returns:
+        tuple: (start, stop, n) suitable for np.linspace
+    """
+    import argparse
+    
+    try:
+        start, stop, n = text.split(':')
+        start, stop, n = float(start), float(stop), int(n)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid range '{text}' (expected start:stop:n, e.g. 1:25:25)"
+        )
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"invalid range '{text}' (n must be >= 1)")
+    return start, stop, n
+
+def print_sweep_results(results, file=None):
+    """Print a compact table of uncertainty results over a wind speed sweep."""
+    
+    lines = [
+        "",
+        _DOUBLE_LINE,
+        _SWEEP_TITLE,
+        _DOUBLE_LINE,
+        f"Calibration OFFSET: {results['offset'][0]:.4f} V    "
+        f"SCALE: {results['scale'][0]:.4f} V/(m/s)",
+        _SINGLE_LINE,
+        f"{'Wind speed':>10} | {'Voltage':>8} | {'u_c(v)':>8} | "
+        f"{'U(k=' + str(results['k']) + ')':>8} | {'Relative':>8}",
+        _SINGLE_LINE,
+    ]
+    for v, V, u, U, rel in zip(results['wind_speed'], results['voltage'],
+                               results['u_combined'], results['U_expanded'],
+                               results['relative_uncertainty_pct']):
+        lines.append(f"{v:>6.2f} m/s | {V:>6.4f} V | {u:>6.4f}   | {U:>6.4f}   | {rel:>7.2f}%")
+    lines.append("")
+    
+    (file or sys.stdout).write("\n".join(lines) + "\n")
+
+def print_results(results, file=None):
+    """
+    Print formatted uncertainty analysis results.
+    
+    The report is assembled first and written to `file` (default: stdout)
+    in a single call.
+    """
+    
+    k = results.k
+    confidence = _K_TO_COVERAGE.get(k)
+    if confidence is None:
+        # Chebyshev lower bound, which is meaningless for k <= 1
+        confidence = f"~{int((1 - 1/k**2)*100)}" if k > 1 else "~0"
+    
+    lines = [
+        "",
+        _DOUBLE_LINE,
+        _REPORT_TITLE,
+        _DOUBLE_LINE,
+        
+        "\nINPUT PARAMETERS:",
+        _SINGLE_LINE,
+        f"Measured voltage (V):          {results.voltage:.4f} V",
+        f"Calibration OFFSET:            {results.offset:.4f} V",
+        f"Calibration SCALE:             {results.scale:.4f} V/(m/s)",
+        f"Calculated wind speed:         {results.wind_speed:.2f} m/s",
+        
+        "\nUNCERTAINTY CONTRIBUTIONS:",
+        _SINGLE_LINE,
+        f"{'Source':<20} | {'Sensitivity':<11} | {'Uncertainty':<11} | {'Contribution'}",
+        _TABLE_SEPARATOR,
+        f"{'Voltage measurement':<20} | {results.dv_dV:>7.3f} m/s/V | {results.u_voltage:>7.4f} V    | {results.contrib_voltage:>7.4f} m/s",
+        f"{'OFFSET constant':<20} | {results.dv_dOffset:>7.3f} m/s/V | {results.u_offset:>7.4f} V    | {results.contrib_offset:>7.4f} m/s",
+        f"{'SCALE constant':<20} | {results.dv_dScale:>7.2f} m²/s  | {results.u_scale:>7.4f} V/m/s | {results.contrib_scale:>7.4f} m/s",
+        
+        "\nCOMBINED UNCERTAINTY:",
+        _SINGLE_LINE,
+        f"Standard uncertainty u_c(v):   {results.u_combined:.4f} m/s",
+        f"Expanded uncertainty U(k={results.k}):   {results.U_expanded:.4f} m/s ({confidence}% confidence)",
+        f"Relative uncertainty:          {results.relative_uncertainty_pct:.2f}%",
+        
+        "\nRESULT:",
+        _DOUBLE_LINE,
+        f"Wind speed: {results.wind_speed:.2f} ± {results.U_expanded:.2f} m/s (k={results.k})",
+        _DOUBLE_LINE,
+    ]
+    
+    quality, recommendation = _QUALITIES[
+        bisect.bisect_right(_QUALITY_THRESHOLDS, results.relative_uncertainty_pct)
+    ]
+    
+    lines += [
+        "\nINTERPRETATION:",
+        _SINGLE_LINE,
+        f"Uncertainty quality: {quality}",
+        f"Recommendation: {recommendation}",
+    ]
+    
+    contribs = (results.contrib_voltage, results.contrib_offset, results.contrib_scale)
+    max_index = max(range(len(contribs)), key=contribs.__getitem__)
+    max_contrib = contribs[max_index]
+    dominant, advice = _DOMINANT_SOURCES[max_index]
+    
+    lines += [
+        "\nDOMINANT UNCERTAINTY SOURCE:",
+        _SINGLE_LINE,
+        f"Largest contributor: {dominant} ({max_contrib:.4f} m/s)",
+        f"To improve accuracy: {advice}",
+        "",
+    ]
+    
+    (file or sys.stdout).write("\n".join(lines) + "\n")
+
+def print_monte_carlo_results(mc, results, file=None):
+    """Print Monte Carlo results alongside the analytic GUM estimate."""
+    
+    lines = [
+        "MONTE CARLO CROSS-CHECK (GUM Supplement 1):",
+        _SINGLE_LINE,
+        f"Trials:                        {mc['n_trials']:,} ({mc['engine']})",
+        f"Mean wind speed:               {mc['mean']:.4f} m/s",
+        f"Standard uncertainty u(v):     {mc['u_combined']:.4f} m/s "
+        f"(analytic: {results.u_combined:.4f} m/s)",
+        f"{mc['coverage'] * 100:.0f}% coverage interval:         "
+        f"[{mc['interval_low']:.4f}, {mc['interval_high']:.4f}] m/s",
+        "",
+    ]
+    
+    (file or sys.stdout).write("\n".join(lines) + "\n")
+
+def _to_columns(results):
+    """Convert results to plain Python values (lists for array fields)."""
+    if isinstance(results, UncertaintyResult):
+        results = results._asdict()
+    return {key: value.tolist() if hasattr(value, 'tolist') else value
+            for key, value in results.items()}
+
+def write_results_json(results, mc=None, file=None):
+    """Write results (and optional Monte Carlo results) as one JSON object."""
+    import json
+    
+    payload = _to_columns(results)
+    if mc is not None:
+        payload['monte_carlo'] = mc
+    (file or sys.stdout).write(json.dumps(payload) + "\n")
+
+def write_results_csv(results, mc=None, file=None):
+    """Write results as CSV with one row per evaluated wind speed."""
+    import csv
+    
+    columns = _to_columns(results)
+    if mc is not None:
+        columns.update({'mc_' + key: value for key, value in mc.items()})
+    
+    n_rows = max((len(v) for v in columns.values() if isinstance(v, list)), default=1)
+    for key, value in columns.items():
+        if not isinstance(value, list):
+            columns[key] = [value] * n_rows
+    
+    writer = csv.writer(file or sys.stdout, lineterminator="\n")
+    writer.writerow(columns.keys())
+    writer.writerows(zip(*columns.values()))
+
+def _parse_fast_args(argv):
+    """
+    Parse the common '--offset X --scale Y --wind-speed Z' form directly.
+    
+    Returns:
+        SimpleNamespace shaped like the argparse result, or None if argv
+        uses any other option (argparse then handles it, including errors)
+    """
+    if len(argv) != 6 or sorted(argv[0::2]) != ['--offset', '--scale', '--wind-speed']:
+        return None
+    try:
+        values = dict(zip(argv[0::2], map(float, argv[1::2])))
+    except ValueError:
+        return None
+    args = types.SimpleNamespace(**_CLI_DEFAULTS)
+    args.offset = values['--offset']
+    args.scale = values['--scale']
+    args.wind_speed = values['--wind-speed']
+    return args
+
+def _build_parser():
+    """Build the full command-line parser."""
+    import argparse
+    
+    def range_default(dest):
+        return '{:g}:{:g}:{}'.format(*_CLI_DEFAULTS[dest])
+    
     parser = argparse.ArgumentParser(
         description='GUM-compliant wind speed uncertainty calculator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -203,6 +857,28 @@ Examples:
     --offset 0.4225 --scale 0.1975 --wind-speed 5.0 \\
     --u-voltage 0.01 --u-offset 0.0024 --u-scale 0.002
 
+  # Sweep 25 wind speeds from 1 to 25 m/s in one vectorized pass
+  python uncertainty-calculator.py \\
+    --offset 0.4225 --scale 0.1975 --sweep --wind-speed-range 1:25:25
+
+  # Cross-check with 10^6 Monte Carlo trials (faster with numba installed)
+  python uncertainty-calculator.py \\
+    --offset 0.4225 --scale 0.1975 --wind-speed 5.0 --monte-carlo 1000000
+
+  # Machine-readable output for use in a pipeline
+  python uncertainty-calculator.py \\
+    --offset 0.4225 --scale 0.1975 --sweep --format csv > sweep.csv
+
+  # Per-sample uncertainty for a whole data logger CSV in one pass
+  python uncertainty-calculator.py \\
+    --offset 0.4225 --scale 0.1975 --csv-in logger.csv --csv-out results.csv
+
+  # What-if grid of u(OFFSET) x u(SCALE), saved as CSV and heatmap
+  python uncertainty-calculator.py \\
+    --offset 0.4225 --scale 0.1975 --wind-speed 5.0 --sensitivity-analysis \\
+    --u-offset-range 0.001:0.01:20 --u-scale-range 0.001:0.005:20 \\
+    --csv-out grid.csv --plot grid.png
+
 Default uncertainties:
   - Voltage: 0.01 V (typical for 4.5-digit multimeter)
   - OFFSET: 0.002 V (typical for 10-reading zero-point calibration)
@@ -217,25 +893,101 @@ For more information, see: hardware/calibration/README.md
                        help='Calibration OFFSET constant (V)')
     parser.add_argument('--scale', type=float, required=True,
                        help='Calibration SCALE constant (V/(m/s))')
-    parser.add_argument('--wind-speed', type=float, required=True,
+    parser.add_argument('--wind-speed', type=float,
                        help='Wind speed at which to evaluate uncertainty (m/s)')
     
+    # Analysis modes (at most one)
+    mode = parser.add_mutually_exclusive_group()
+    
+    # Sweep mode
+    mode.add_argument('--sweep', action='store_true',
+                     help='Evaluate uncertainty over a range of wind speeds')
+    parser.add_argument('--wind-speed-range', type=parse_range, metavar='START:STOP:N',
+                       help=f'Wind speed range for --sweep (m/s) '
+                            f'[default: {range_default("wind_speed_range")}]')
+    
+    # Monte Carlo cross-check
+    parser.add_argument('--monte-carlo', type=int, metavar='TRIALS',
+                       help='Also run a Monte Carlo simulation with TRIALS samples')
+    
+    # CSV batch mode
+    mode.add_argument('--csv-in', metavar='FILE',
+                     help='Process every voltage in the first column of this CSV file')
+    parser.add_argument('--csv-out', metavar='FILE',
+                       help='Output CSV for --csv-in or --sensitivity-analysis [default: stdout]')
+    parser.add_argument('--csv-skiprows', type=int, metavar='N',
+                       help=f'Rows to skip at the top of --csv-in, e.g. 1 for a header '
+                            f'[default: {_CLI_DEFAULTS["csv_skiprows"]}]')
+    
+    # Sensitivity analysis mode
+    mode.add_argument('--sensitivity-analysis', action='store_true',
+                     help='Tabulate u_c(v) over a grid of u(OFFSET) x u(SCALE) at --wind-speed')
+    parser.add_argument('--u-offset-range', type=parse_range, metavar='START:STOP:N',
+                       help=f'u(OFFSET) values for --sensitivity-analysis (V) '
+                            f'[default: {range_default("u_offset_range")}]')
+    parser.add_argument('--u-scale-range', type=parse_range, metavar='START:STOP:N',
+                       help=f'u(SCALE) values for --sensitivity-analysis (V/(m/s)) '
+                            f'[default: {range_default("u_scale_range")}]')
+    parser.add_argument('--plot', metavar='FILE',
+                       help='Also save a heatmap of the sensitivity grid (requires matplotlib)')
+    
+    # Output format
+    parser.add_argument('--format', choices=['text', 'json', 'csv'],
+                       help=f'Output format [default: {_CLI_DEFAULTS["format"]}]')
+    
     # Optional uncertainty arguments with defaults
-    parser.add_argument('--u-voltage', type=float, default=0.01,
-                       help='Standard uncertainty in voltage measurement (V) [default: 0.01]')
-    parser.add_argument('--u-offset', type=float, default=0.002,
-                       help='Standard uncertainty in OFFSET (V) [default: 0.002]')
-    parser.add_argument('--u-scale', type=float, default=0.002,
-                       help='Standard uncertainty in SCALE (V/(m/s)) [default: 0.002]')
+    parser.add_argument('--u-voltage', type=float,
+                       help=f'Standard uncertainty in voltage measurement (V) [default: {DEFAULT_U_VOLTAGE}]')
+    parser.add_argument('--u-offset', type=float,
+                       help=f'Standard uncertainty in OFFSET (V) [default: {DEFAULT_U_OFFSET}]')
+    parser.add_argument('--u-scale', type=float,
+                       help=f'Standard uncertainty in SCALE (V/(m/s)) [default: {DEFAULT_U_SCALE}]')
+    
+    # Same defaults as the fast path in _parse_fast_args()
+    parser.set_defaults(**_CLI_DEFAULTS)
+    
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
     
-    args = parser.parse_args()
+    # Common single-point case: skip building the argparse parser
+    args = _parse_fast_args(argv)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        
+        if args.wind_speed is None and not (args.sweep or args.csv_in):
+            parser.error("--wind-speed is required unless --sweep or --csv-in is given")
+        
+        if args.monte_carlo is not None and (args.sweep or args.csv_in or args.sensitivity_analysis):
+            parser.error("--monte-carlo cannot be combined with --sweep, --csv-in "
+                         "or --sensitivity-analysis")
+        
+        if args.csv_out and not (args.csv_in or args.sensitivity_analysis):
+            parser.error("--csv-out requires --csv-in or --sensitivity-analysis "
+                         "(use --format csv to write CSV to stdout)")
+        
+        if args.plot and not args.sensitivity_analysis:
+            parser.error("--plot requires --sensitivity-analysis")
+        
+        if args.format != _CLI_DEFAULTS['format'] and (args.csv_in or args.sensitivity_analysis):
+            parser.error("--format cannot be combined with --csv-in or "
+                         "--sensitivity-analysis (their output is always CSV)")
     
     # Validate inputs
     if args.scale <= 0:
         print("ERROR: SCALE must be positive", file=sys.stderr)
         sys.exit(1)
     
-    if args.wind_speed < 0:
+    if args.sweep:
+        start, stop, _ = args.wind_speed_range
+        lowest_wind_speed = min(start, stop)
+    else:
+        lowest_wind_speed = args.wind_speed
+    
+    if lowest_wind_speed is not None and lowest_wind_speed < 0:
         print("ERROR: Wind speed cannot be negative", file=sys.stderr)
         sys.exit(1)
     
@@ -243,8 +995,50 @@ For more information, see: hardware/calibration/README.md
         print("ERROR: Uncertainties cannot be negative", file=sys.stderr)
         sys.exit(1)
     
+    if args.sensitivity_analysis and min(*args.u_offset_range[:2], *args.u_scale_range[:2]) < 0:
+        print("ERROR: Uncertainties cannot be negative", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.monte_carlo is not None and args.monte_carlo < 2:
+        print("ERROR: Monte Carlo needs at least 2 trials", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.csv_in:
+        try:
+            process_csv(
+                args.csv_in, args.csv_out or sys.stdout,
+                args.offset, args.scale,
+                args.u_voltage, args.u_offset, args.u_scale,
+                skiprows=args.csv_skiprows
+            )
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Could not process {args.csv_in}: {e}", file=sys.stderr)
+            sys.exit(1)
+        return 0
+    
+    if args.sensitivity_analysis:
+        np = _numpy()
+        u_offset_values = np.linspace(*args.u_offset_range)
+        u_scale_values = np.linspace(*args.u_scale_range)
+        voltage = calculate_voltage_from_wind_speed(args.wind_speed, args.offset, args.scale)
+        grid = calculate_sensitivity_grid(
+            voltage, args.offset, args.scale,
+            args.u_voltage, u_offset_values, u_scale_values
+        )
+        write_sensitivity_grid(grid, u_offset_values, u_scale_values,
+                               args.csv_out or sys.stdout)
+        if args.plot:
+            plot_sensitivity_grid(grid, u_offset_values, u_scale_values,
+                                  args.wind_speed, args.plot)
+        return 0
+    
+    if args.sweep:
+        wind_speed = _numpy().linspace(*args.wind_speed_range)
+    else:
+        wind_speed = args.wind_speed
+    
     # Calculate voltage from wind speed
-    voltage = calculate_voltage_from_wind_speed(args.wind_speed, args.offset, args.scale)
+    voltage = calculate_voltage_from_wind_speed(wind_speed, args.offset, args.scale)
     
     # Perform uncertainty analysis
     results = calculate_combined_uncertainty(
@@ -252,8 +1046,26 @@ For more information, see: hardware/calibration/README.md
         args.u_voltage, args.u_offset, args.u_scale
     )
     
+    mc = None
+    if args.monte_carlo is not None:
+        mc = monte_carlo_uncertainty(
+            voltage, args.offset, args.scale,
+            args.u_voltage, args.u_offset, args.u_scale,
+            n_trials=args.monte_carlo
+        )
+    
     # Print results
-    print_results(results)
+    if args.format == 'json':
+        write_results_json(results, mc)
+    elif args.format == 'csv':
+        write_results_csv(results, mc)
+    else:
+        if args.sweep:
+            print_sweep_results(results)
+        else:
+            print_results(results)
+        if mc is not None:
+            print_monte_carlo_results(mc, results)
     
     return 0
 
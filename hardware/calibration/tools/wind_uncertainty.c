@@ -0,0 +1,45 @@
+/*
+ * Wind Speed Uncertainty - C Batch Kernel
+ * =======================================
+ * Optional fast path for uncertainty-calculator.py when processing
+ * streamed DAQ data. Evaluates the calibration equation and the GUM
+ * combined standard uncertainty for every voltage sample:
+ *
+ *   v   = (V - OFFSET) / SCALE
+ *   u_c = sqrt((u(V)/SCALE)^2 + (u(OFFSET)/SCALE)^2 + ((V - OFFSET) u(SCALE)/SCALE^2)^2)
+ *
+ * Build (from hardware/calibration/tools):
+ *   gcc -O3 -march=native -ffast-math -shared -fPIC \
+ *       -o libwind_uncertainty.so wind_uncertainty.c -lm
+ *
+ * uncertainty-calculator.py loads libwind_uncertainty.so from this folder
+ * via ctypes and falls back to NumPy when it has not been built.
+ *
+ * Author: Dr. Asitha Kulasekera
+ * License: MIT
+ * Repository: github.com/asithakal/wind-turbine-daq-guide
+ */
+
+#include <math.h>
+#include <stddef.h>
+
+void wind_uncertainty_batch(const double *restrict V, size_t n,
+                            double offset, double scale,
+                            double u_v, double u_o, double u_s,
+                            double *restrict v_out, double *restrict u_out)
+{
+    const double inv_scale = 1.0 / scale;
+
+    /* Voltage and OFFSET terms do not depend on V: fold them once */
+    const double a = inv_scale * u_v;
+    const double b = inv_scale * u_o;
+    const double ab_sq = fma(a, a, b * b);
+    const double c_coef = inv_scale * inv_scale * u_s;
+
+    for (size_t i = 0; i < n; i++) {
+        const double delta = V[i] - offset;
+        const double c = delta * c_coef;
+        v_out[i] = delta * inv_scale;
+        u_out[i] = sqrt(fma(c, c, ab_sq));
+    }
+}